@@ -1,6 +1,11 @@
+import os
+
+import numpy as np
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+
+DATA_PATH = "final_property_data.feather"
 
 # -------------------------------------------------
 # Page configuration
@@ -13,11 +18,68 @@ st.set_page_config(
 # -------------------------------------------------
 # Load data (cached for performance)
 # -------------------------------------------------
-@st.cache_data
+# cache_resource skips hashing/serializing the DataFrame on every
+# rerun; safe here because the app only ever reads df, never mutates it.
+@st.cache_resource
 def load_data():
-    return pd.read_csv("final_property_data.csv")
+    # Feather memory-maps the file and column pruning keeps the read
+    # to the columns the dashboard actually uses.
+    return pd.read_feather(
+        DATA_PATH,
+        columns=[
+            "zip_code",
+            "listing_price",
+            "sq_ft",
+            "price_per_sqft",
+            "median_income",
+            "school_rating"
+        ]
+    )
+
+@st.cache_resource
+def load_filter_arrays():
+    # Raw arrays behind the hot filter path, pulled out of the
+    # DataFrame once per session; every rerun then works on plain
+    # NumPy with no per-column indexer or Series allocation.
+    return (
+        df['zip_code'].cat.codes.to_numpy(),
+        df['listing_price'].to_numpy(),
+        df['median_income'].to_numpy()
+    )
+
+@st.cache_resource
+def load_sorted_view():
+    # The listings table is always shown ordered by price descending;
+    # sort once per session and keep the positional order so the
+    # per-rerun filter mask can be carried over to the sorted copy.
+    df_sorted = df.sort_values("listing_price", ascending=False)
+    sort_order = df.index.get_indexer(df_sorted.index)
+    return df_sorted.reset_index(drop=True), sort_order
+
+@st.cache_data
+def get_filter_domain(dataset_mtime):
+    # Sidebar options and slider bounds never change between reruns,
+    # so compute them once per dataset (keyed by file mtime) instead
+    # of on every slider tick.
+    return (
+        df['zip_code'].cat.categories.tolist(),
+        int(df['listing_price'].min()),
+        int(df['listing_price'].max()),
+        int(df['median_income'].min()),
+        int(df['median_income'].max())
+    )
 
 df = load_data()
+zip_codes, listing_prices, median_incomes = load_filter_arrays()
+df_sorted, sort_order = load_sorted_view()
+
+(
+    zip_options,
+    price_min,
+    price_max,
+    income_min,
+    income_max
+) = get_filter_domain(os.path.getmtime(DATA_PATH))
 
 # -------------------------------------------------
 # Title & How-to section
@@ -42,8 +104,7 @@ st.sidebar.caption(
     "Adjust filters below to analyze different neighborhoods and pricing scenarios."
 )
 
-# ZIP filter
-zip_options = sorted(df['zip_code'].unique())
+# ZIP filter (categories are already sorted by the pipeline)
 selected_zips = st.sidebar.multiselect(
     "Select ZIP Code(s)",
     options=zip_options,
@@ -51,7 +112,6 @@ selected_zips = st.sidebar.multiselect(
 )
 
 # Listing price filter
-price_min, price_max = int(df['listing_price'].min()), int(df['listing_price'].max())
 selected_price = st.sidebar.slider(
     "Listing Price Range ($)",
     min_value=price_min,
@@ -60,7 +120,6 @@ selected_price = st.sidebar.slider(
 )
 
 # Median income filter
-income_min, income_max = int(df['median_income'].min()), int(df['median_income'].max())
 selected_income = st.sidebar.slider(
     "Median Income Range ($)",
     min_value=income_min,
@@ -71,11 +130,24 @@ selected_income = st.sidebar.slider(
 # -------------------------------------------------
 # Apply filters
 # -------------------------------------------------
-filtered_df = df[
-    (df['zip_code'].isin(selected_zips)) &
-    (df['listing_price'].between(*selected_price)) &
-    (df['median_income'].between(*selected_income))
-]
+# One fused NumPy pass over the session-cached raw arrays instead of
+# three intermediate boolean Series. ZIP membership is an np.isin over
+# the categorical codes against the handful of selected category
+# codes — integer compares, no per-row string hashing.
+selected_codes = np.flatnonzero(
+    df['zip_code'].cat.categories.isin(selected_zips)
+)
+
+mask = (
+    np.isin(zip_codes, selected_codes)
+    & (listing_prices >= selected_price[0])
+    & (listing_prices <= selected_price[1])
+    & (median_incomes >= selected_income[0])
+    & (median_incomes <= selected_income[1])
+)
+
+# Single positional take — the only pandas-level allocation per rerun
+filtered_df = df.iloc[np.nonzero(mask)[0]]
 
 if filtered_df.empty:
     st.warning("No data available for selected filters.")
@@ -88,24 +160,29 @@ st.markdown("## 📊 Key Metrics")
 
 c1, c2, c3, c4 = st.columns(4)
 
+# One aggregation pass instead of four separate .mean() calls
+means = filtered_df[
+    ["listing_price", "price_per_sqft", "median_income", "school_rating"]
+].mean()
+
 c1.metric(
     "Avg Listing Price",
-    f"${filtered_df['listing_price'].mean():,.0f}"
+    f"${means['listing_price']:,.0f}"
 )
 
 c2.metric(
     "Avg Price per Sq Ft",
-    f"${filtered_df['price_per_sqft'].mean():,.0f}"
+    f"${means['price_per_sqft']:,.0f}"
 )
 
 c3.metric(
     "Avg Median Income",
-    f"${filtered_df['median_income'].mean():,.0f}"
+    f"${means['median_income']:,.0f}"
 )
 
 c4.metric(
     "Avg School Rating",
-    f"{filtered_df['school_rating'].mean():.1f}"
+    f"{means['school_rating']:.1f}"
 )
 
 st.caption("📌 KPIs reflect averages based on your current filter selection.")
@@ -118,68 +195,101 @@ st.markdown("---")
 st.markdown("## 📈 Property Insights")
 
 # School Rating vs Listing Price
-fig_school_price = px.scatter(
-    filtered_df,
-    x="school_rating",
-    y="listing_price",
-    color="median_income",
-    size="sq_ft",
-    hover_data={
-        "zip_code": True,
-        "listing_price": ":,.0f",
-        "sq_ft": True,
-        "median_income": ":,.0f"
-    },
-    labels={
-        "school_rating": "School Rating (1 = Low, 10 = High)",
-        "listing_price": "Listing Price ($)",
-        "median_income": "Median Income ($)"
-    },
-    title="💡 How School Quality Impacts Property Prices"
+# Scattergl renders the points on the GPU via WebGL, so large filtered
+# selections stay responsive in the browser (px.scatter draws SVG).
+sq_ft = filtered_df['sq_ft'].to_numpy()
+
+fig_school_price = go.Figure(
+    go.Scattergl(
+        x=filtered_df['school_rating'].to_numpy(),
+        y=filtered_df['listing_price'].to_numpy(),
+        mode="markers",
+        marker=dict(
+            color=filtered_df['median_income'].to_numpy(),
+            colorbar=dict(title="Median Income"),
+            size=sq_ft,
+            sizemode="area",
+            sizeref=2.0 * float(sq_ft.max()) / (20.0 ** 2)
+        ),
+        customdata=np.column_stack([
+            filtered_df['zip_code'].astype(str),
+            filtered_df['median_income'].to_numpy()
+        ]),
+        hovertemplate=(
+            "ZIP: %{customdata[0]}<br>"
+            "School Rating: %{x}<br>"
+            "Listing Price: $%{y:,.0f}<br>"
+            "Sq Ft: %{marker.size}<br>"
+            "Median Income: $%{customdata[1]:,.0f}"
+            "<extra></extra>"
+        )
+    )
 )
 
 fig_school_price.update_layout(
+    title="💡 How School Quality Impacts Property Prices",
     title_x=0.5,
-    legend_title_text="Median Income"
+    xaxis_title="School Rating (1 = Low, 10 = High)",
+    yaxis_title="Listing Price ($)"
 )
 
 st.plotly_chart(fig_school_price, use_container_width=True)
 
 # Median Income vs Price per Sq Ft
-fig_income_pps = px.scatter(
-    filtered_df,
-    x="median_income",
-    y="price_per_sqft",
-    color="school_rating",
-    hover_data={
-        "zip_code": True,
-        "price_per_sqft": ":,.0f",
-        "school_rating": True
-    },
-    labels={
-        "median_income": "Median Household Income ($)",
-        "price_per_sqft": "Price per Sq Ft ($)",
-        "school_rating": "School Rating"
-    },
-    title="💰 Neighborhood Income vs Property Value (Price per Sq Ft)"
-)
-
-fig_income_pps.update_layout(title_x=0.5)
+fig_income_pps = go.Figure(
+    go.Scattergl(
+        x=filtered_df['median_income'].to_numpy(),
+        y=filtered_df['price_per_sqft'].to_numpy(),
+        mode="markers",
+        marker=dict(
+            color=filtered_df['school_rating'].to_numpy(),
+            colorbar=dict(title="School Rating")
+        ),
+        customdata=filtered_df['zip_code'].astype(str),
+        hovertemplate=(
+            "ZIP: %{customdata}<br>"
+            "Median Income: $%{x:,.0f}<br>"
+            "Price per Sq Ft: $%{y:,.0f}"
+            "<extra></extra>"
+        )
+    )
+)
+
+fig_income_pps.update_layout(
+    title="💰 Neighborhood Income vs Property Value (Price per Sq Ft)",
+    title_x=0.5,
+    xaxis_title="Median Household Income ($)",
+    yaxis_title="Price per Sq Ft ($)"
+)
 
 st.plotly_chart(fig_income_pps, use_container_width=True)
 
 # Listing Price Distribution
-fig_price_dist = px.histogram(
-    filtered_df,
-    x="listing_price",
-    nbins=25,
-    labels={"listing_price": "Listing Price ($)"},
-    title="📊 Distribution of Property Listing Prices"
+# Bin server-side and send 25 bar heights to the browser instead of
+# shipping every filtered price for Plotly to bin client-side
+counts, edges = np.histogram(
+    filtered_df['listing_price'].to_numpy(), bins=25
+)
+
+fig_price_dist = go.Figure(
+    go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        hovertemplate=(
+            "Listing Price: $%{x:,.0f}<br>"
+            "Properties: %{y}"
+            "<extra></extra>"
+        )
+    )
 )
 
 fig_price_dist.update_layout(
+    title="📊 Distribution of Property Listing Prices",
     title_x=0.5,
-    yaxis_title="Number of Properties"
+    xaxis_title="Listing Price ($)",
+    yaxis_title="Number of Properties",
+    bargap=0
 )
 
 st.plotly_chart(fig_price_dist, use_container_width=True)
@@ -194,8 +304,11 @@ st.caption(
     "This table shows property-level details for deeper inspection."
 )
 
+# Slice the pre-sorted copy with the same filter mask instead of
+# re-sorting the filtered rows on every rerun
 st.dataframe(
-    filtered_df[
+    df_sorted.loc[
+        mask[sort_order],
         [
             "zip_code",
             "listing_price",
@@ -204,6 +317,6 @@ st.dataframe(
             "median_income",
             "school_rating"
         ]
-    ].sort_values("listing_price", ascending=False),
+    ],
     use_container_width=True
 )
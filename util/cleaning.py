@@ -1,7 +1,47 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv
 import re
 
 
+# Explicit column types so the CSV reader skips its type-inference pass.
+# Float32 is plenty of precision for prices/areas and halves memory
+# versus the default float64.
+LISTING_TYPES = {
+    "raw_address": pa.string(),
+    "postal_code": pa.string(),
+    "sq_ft": pa.float32(),
+    "bedrooms": pa.int16(),
+    "listing_price": pa.float32(),
+}
+
+DEMO_TYPES = {
+    "zip_code": pa.string(),
+    "median_income": pa.float32(),
+    "school_rating": pa.float32(),
+    "crime_index": pa.string(),
+}
+
+# Compiled once at import; str.extract would otherwise recompile the
+# pattern on every call.
+_ZIP_RE = re.compile(r'(\d{5})')
+
+
+def _read_csv_arrow(path: str, column_types: dict) -> pd.DataFrame:
+    """
+    Read a CSV with pyarrow's multithreaded parser and return an
+    Arrow-backed DataFrame (zero-copy conversion, nullable columns).
+    """
+    table = pa.csv.read_csv(
+        path,
+        read_options=pa.csv.ReadOptions(block_size=8 << 20),
+        convert_options=pa.csv.ConvertOptions(column_types=column_types)
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
 def load_raw_data(
     listings_path: str,
     demographics_path: str
@@ -9,36 +49,72 @@ def load_raw_data(
     """
     Load raw listings and demographics data.
     """
-    listings = pd.read_csv(listings_path)
-    demographics = pd.read_csv(demographics_path)
+    listings = _read_csv_arrow(listings_path, LISTING_TYPES)
+    demographics = _read_csv_arrow(demographics_path, DEMO_TYPES)
     return listings, demographics
 
 
 def clean_postal_code(series: pd.Series) -> pd.Series:
     """
     Standardize postal/ZIP codes to 5-digit strings.
+
+    Arrow-backed columns take a fast path through pyarrow.compute,
+    which runs the regex over the whole buffer in C++ instead of
+    element-by-element through Python.
     """
-    series = series.astype(str)
-    series = series.str.extract(r'(\d{5})')
-    return series
+    if isinstance(series.dtype, pd.ArrowDtype):
+        arr = series.array._pa_array
+        if not pa.types.is_string(arr.type):
+            arr = pc.cast(arr, pa.string())
+        extracted = pc.extract_regex(arr, pattern=r'(?P<zip>\d{5})')
+        return pd.Series(
+            pc.struct_field(extracted, "zip"),
+            index=series.index,
+            dtype=pd.ArrowDtype(pa.string())
+        )
+
+    if not pd.api.types.is_string_dtype(series):
+        series = series.astype("string")
+    return series.str.extract(_ZIP_RE, expand=False)
 
 
 def clean_listings_data(listings: pd.DataFrame) -> pd.DataFrame:
     """
     Clean and prepare listings data.
+
+    The input frame is modified in place and returned; callers that
+    need the raw data untouched should pass a copy.
     """
-    df = listings.copy()
+    df = listings
 
     # Clean ZIP code
     df["zip_code"] = clean_postal_code(df["postal_code"])
 
-    # Ensure numeric fields
-    df["listing_price"] = pd.to_numeric(df["listing_price"], errors="coerce")
-    df["sq_ft"] = pd.to_numeric(df["sq_ft"], errors="coerce")
-    df["bedrooms"] = pd.to_numeric(df["bedrooms"], errors="coerce")
+    # Ensure numeric fields, downcast so every downstream filter and
+    # aggregation moves half the bytes of the default 64-bit types
+    df["listing_price"] = pd.to_numeric(
+        df["listing_price"], errors="coerce", downcast="float"
+    )
+    df["sq_ft"] = pd.to_numeric(
+        df["sq_ft"], errors="coerce", downcast="float"
+    )
+    df["bedrooms"] = pd.to_numeric(
+        df["bedrooms"], errors="coerce", downcast="integer"
+    )
+
+    # Create price per sq ft: one vectorized NumPy pass over the raw
+    # arrays instead of pandas-level division, with zero/invalid sq_ft
+    # mapped to NaN rather than inf
+    listing_price = df["listing_price"].to_numpy()
+    sq_ft = df["sq_ft"].to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        price_per_sqft = listing_price / sq_ft
+    price_per_sqft[~np.isfinite(price_per_sqft)] = np.nan
+    df["price_per_sqft"] = price_per_sqft
 
-    # Create price per sq ft
-    df["price_per_sqft"] = df["listing_price"] / df["sq_ft"]
+    # Categorical ZIP: merge and filtering work on integer codes
+    # instead of hashing strings per row
+    df["zip_code"] = df["zip_code"].astype("category")
 
     return df
 
@@ -46,16 +122,27 @@ def clean_listings_data(listings: pd.DataFrame) -> pd.DataFrame:
 def clean_demographics_data(demographics: pd.DataFrame) -> pd.DataFrame:
     """
     Clean and prepare demographics data.
+
+    The input frame is modified in place and returned; callers that
+    need the raw data untouched should pass a copy.
     """
-    df = demographics.copy()
+    df = demographics
 
     # Standardize ZIP code
     df["zip_code"] = clean_postal_code(df["zip_code"])
 
-    # Ensure numeric fields
-    df["median_income"] = pd.to_numeric(df["median_income"], errors="coerce")
-    df["school_rating"] = pd.to_numeric(df["school_rating"], errors="coerce")
-    df["crime_index"] = pd.to_numeric(df["crime_index"], errors="coerce")
+    # Ensure numeric fields, downcast to the narrowest type that fits
+    df["median_income"] = pd.to_numeric(
+        df["median_income"], errors="coerce", downcast="float"
+    )
+    df["school_rating"] = pd.to_numeric(
+        df["school_rating"], errors="coerce", downcast="float"
+    )
+    df["crime_index"] = pd.to_numeric(
+        df["crime_index"], errors="coerce", downcast="float"
+    )
+
+    df["zip_code"] = df["zip_code"].astype("category")
 
     return df
 
@@ -66,40 +153,101 @@ def merge_datasets(
 ) -> pd.DataFrame:
     """
     Merge cleaned listings and demographics into a single dataset.
+
+    Demographics is a small per-ZIP lookup, so rather than a row-level
+    hash join, each demographic column is mapped onto the listings
+    through the ZIP categorical — every unique ZIP is resolved once,
+    not once per listing. Columns are added to the listings frame in
+    place, matching the cleaners' in-place contract.
     """
-    merged_df = listings.merge(
-        demographics,
-        on="zip_code",
-        how="left"
-    )
-    return merged_df
+    lookup = demographics.set_index("zip_code")
+    for column in lookup.columns:
+        # map on a categorical key returns a Categorical when the
+        # looked-up values are unique; cast back to the lookup dtype
+        # so numeric columns stay numeric
+        listings[column] = (
+            listings["zip_code"]
+            .map(lookup[column])
+            .astype(lookup[column].dtype)
+        )
+    return listings
 
 
 def prepare_final_dataset(
     listings_path: str,
     demographics_path: str,
-    output_path: str = "final_property_data.csv"
+    output_path: str = "final_property_data.feather"
 ) -> pd.DataFrame:
     """
     Full pipeline:
     load → clean → merge → export final dataset
-    """
-    listings, demographics = load_raw_data(
-        listings_path, demographics_path
-    )
 
-    listings_clean = clean_listings_data(listings)
+    The final dataset is written as Feather v2 (Arrow IPC with lz4),
+    which writes native column buffers — no per-value string
+    formatting — and memory-maps on load, so the dashboard's cold
+    start costs almost nothing.
+
+    Listings are streamed block by block and written as Arrow record
+    batches, so peak memory is one block plus the demographics lookup
+    rather than three copies of the full listings file.
+    """
+    demographics = _read_csv_arrow(demographics_path, DEMO_TYPES)
     demographics_clean = clean_demographics_data(demographics)
 
-    final_df = merge_datasets(
-        listings_clean, demographics_clean
+    # Rows whose ZIP has no demographics match lose median_income in
+    # the merge and are dropped below, so the demographics ZIP set is
+    # a valid fixed category set for every chunk — which keeps one
+    # schema (and one dictionary) across every record batch, as the
+    # IPC file format requires.
+    zip_categories = demographics_clean["zip_code"].cat.categories
+
+    writer = None
+    reader = pa.csv.open_csv(
+        listings_path,
+        read_options=pa.csv.ReadOptions(block_size=8 << 20),
+        convert_options=pa.csv.ConvertOptions(column_types=LISTING_TYPES)
     )
-
-    # Drop rows missing core business metrics
-    final_df = final_df.dropna(
-        subset=["listing_price", "sq_ft", "median_income"]
+    try:
+        for batch in reader:
+            chunk = pa.Table.from_batches([batch]).to_pandas(
+                types_mapper=pd.ArrowDtype
+            )
+            chunk = clean_listings_data(chunk)
+            chunk["zip_code"] = (
+                chunk["zip_code"].cat.set_categories(zip_categories)
+            )
+
+            merged = merge_datasets(chunk, demographics_clean)
+
+            # Drop rows missing core business metrics
+            merged = merged.dropna(
+                subset=["listing_price", "sq_ft", "median_income"]
+            )
+
+            table = pa.Table.from_pandas(merged, preserve_index=False)
+            if writer is None:
+                writer = pa.ipc.new_file(
+                    output_path,
+                    table.schema,
+                    options=pa.ipc.IpcWriteOptions(compression="lz4")
+                )
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+        reader.close()
+
+    final_df = pd.read_feather(output_path)
+
+    # Keep the category set tight and sorted for the dashboard's
+    # ZIP filter options; rewrite only if streaming left unused
+    # categories behind
+    tidy = final_df["zip_code"].cat.remove_unused_categories()
+    tidy = tidy.cat.reorder_categories(
+        tidy.cat.categories.sort_values()
     )
-
-    final_df.to_csv(output_path, index=False)
+    if not tidy.cat.categories.equals(final_df["zip_code"].cat.categories):
+        final_df["zip_code"] = tidy
+        final_df.to_feather(output_path, compression="lz4")
 
     return final_df